@@ -4,19 +4,25 @@ class MyFirstModel(BaseModel):
     first_name: str
     last_name: str
 
+# Collect output lines and join them once at the end: one print syscall per
+# block instead of one per line, and no partially-flushed output in between.
+lines = []
+
 # Test the basic example
-print("=== Example 1: Basic Model ===")
+lines.append("=== Example 1: Basic Model ===")
 try:
     validating = MyFirstModel(first_name="marc", last_name="nealer")
-    print(f"✅ Valid data: {validating}")
-    print(f"   First name: {validating.first_name}")
-    print(f"   Last name: {validating.last_name}")
+    lines.append(f"✅ Valid data: {validating}")
+    lines.append(f"   First name: {validating.first_name}")
+    lines.append(f"   Last name: {validating.last_name}")
 except Exception as e:
-    print(f"❌ Error: {e}")
+    lines.append(f"❌ Error: {e}")
 
-print("\n--- Testing invalid data ---")
+lines.append("\n--- Testing invalid data ---")
 try:
     invalid = MyFirstModel(first_name=123, last_name="nealer")  # first_name should be string
-    print(f"✅ This should not print: {invalid}")
+    lines.append(f"✅ This should not print: {invalid}")
 except Exception as e:
-    print(f"❌ Expected error: {e}") 
\ No newline at end of file
+    lines.append(f"❌ Expected error: {e}")
+
+print("\n".join(lines))
@@ -8,36 +8,34 @@ class NameModel(BaseModel):
 
 print("=== Understanding Union[str, None] ===")
 
-print("\n--- Test 1: With middle name ---")
-name1 = NameModel(
-    first_name="John",
-    middle_name="Michael",  # String value
-    last_name="Doe"
-)
-print(f"✅ Result: {name1}")
-print(f"   First: {name1.first_name}")
-print(f"   Middle: {name1.middle_name}")
-print(f"   Last: {name1.last_name}")
+# The three demos only differ in their input kwargs, so describe each as a
+# (title, kwargs) pair and loop - one construction/print block instead of
+# three copies.
+CASES = [
+    ("Test 1: With middle name", {
+        "first_name": "John",
+        "middle_name": "Michael",  # String value
+        "last_name": "Doe",
+    }),
+    ("Test 2: Without middle name", {
+        "first_name": "Jane",
+        # middle_name not provided - becomes None
+        "last_name": "Smith",
+    }),
+    ("Test 3: Explicitly None", {
+        "first_name": "Bob",
+        "middle_name": None,  # Explicitly None
+        "last_name": "Johnson",
+    }),
+]
 
-print("\n--- Test 2: Without middle name ---")
-name2 = NameModel(
-    first_name="Jane",
-    # middle_name not provided - becomes None
-    last_name="Smith"
-)
-print(f"✅ Result: {name2}")
-print(f"   First: {name2.first_name}")
-print(f"   Middle: {name2.middle_name}")  # This will be None
-print(f"   Last: {name2.last_name}")
-
-print("\n--- Test 3: Explicitly None ---")
-name3 = NameModel(
-    first_name="Bob",
-    middle_name=None,  # Explicitly None
-    last_name="Johnson"
-)
-print(f"✅ Result: {name3}")
-print(f"   Middle: {name3.middle_name}")
+for title, kwargs in CASES:
+    print(f"\n--- {title} ---")
+    name = NameModel(**kwargs)
+    print(f"✅ Result: {name}")
+    print(f"   First: {name.first_name}")
+    print(f"   Middle: {name.middle_name}")  # None when omitted or explicit
+    print(f"   Last: {name.last_name}")
 
 print("\n--- What Union[str, None] means ---")
 print("• The field can accept a string value")
@@ -45,4 +43,4 @@ print("• The field can accept None")
 print("• The field can be omitted entirely (becomes None)")
 print("• It does NOT combine or merge names")
 print("• It does NOT make last_name optional")
-print("• It's just type validation: 'accept string or None'") 
\ No newline at end of file
+print("• It's just type validation: 'accept string or None'")
@@ -30,6 +30,19 @@ class DefaultsModel_Field(BaseModel):
 # Using Field with default_factory ensures a new list is created for each instance.
 # Modifying one instance's 'middle_name' does NOT affect others.
 
+# --- Fast path for bulk construction ---
+def make_default() -> DefaultsModel_Field:
+    """Build an all-defaults instance without running validation.
+
+    model_construct skips pydantic-core's validate_python entirely, which is
+    where most of the time goes when instantiating in a tight loop. Only use
+    it when the inputs are trusted - here the defaults are known-good, so
+    there is nothing to validate. We still pass middle_name=[] explicitly so
+    each instance gets its own list (model_construct does call the
+    default_factory, but being explicit keeps the footgun lesson visible).
+    """
+    return DefaultsModel_Field.model_construct(middle_name=[])
+
 # --- Example: Demonstrate the correct behavior ---
 print("\n=== Using Field (No Sharing) ===")
 x = DefaultsModel_Field()
@@ -39,6 +52,32 @@ print("x.middle_name:", x.middle_name)  # ['Holden']
 print("y.middle_name:", y.middle_name)  # []  <-- Correct: not shared!
 # x.middle_name is ['Holden'], y.middle_name is []
 
+# --- Example: Demonstrate the fast path ---
+print("\n=== Using model_construct (No Validation) ===")
+p = make_default()
+q = make_default()
+p.middle_name.append("Rae")  # Only p is affected
+print("p.middle_name:", p.middle_name)  # ['Rae']
+print("q.middle_name:", q.middle_name)  # []  <-- Still not shared!
+
+# --- Sidestep the footgun entirely: use an immutable default ---
+class DefaultsModel_Tuple(BaseModel):
+    first_name: str = "Cynthia"
+    middle_name: tuple = ()   # ✅ Tuples can't be mutated, so sharing is harmless
+    last_name: str = "Frong"
+
+# If the field doesn't need in-place mutation, an immutable type removes the
+# problem instead of working around it: a shared () can never leak state
+# between instances, and no default_factory is needed. "Adding" a middle name
+# means replacing the tuple, which only ever touches one instance.
+
+# --- Example: Demonstrate the immutable default ---
+print("\n=== Using a Tuple Default (Immutable) ===")
+m = DefaultsModel_Tuple()
+n = DefaultsModel_Tuple(middle_name=("Marie",))  # replace, don't mutate
+print("m.middle_name:", m.middle_name)  # ()
+print("n.middle_name:", n.middle_name)  # ('Marie',)
+
 # --- Summary ---
 # Use Field(default_factory=list) for mutable defaults to avoid shared state between instances.
 # This is a common Python pitfall, not just a Pydantic issue, but Pydantic makes it easy to do the right thing. 
\ No newline at end of file
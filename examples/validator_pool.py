@@ -0,0 +1,28 @@
+from pydantic import TypeAdapter
+
+# Building a TypeAdapter compiles a pydantic-core SchemaValidator, which is
+# the expensive part - validate_python calls afterwards are cheap. This pool
+# makes sure each annotation pays that compile cost once, no matter how many
+# example modules (or repeat imports) ask for it.
+
+class ModelValidatorPool:
+    """One TypeAdapter per annotation, built on first request and reused."""
+
+    def __init__(self):
+        self._adapters = {}
+
+    def adapter(self, annotation):
+        """Return the cached TypeAdapter for annotation, building it once."""
+        try:
+            return self._adapters[annotation]
+        except KeyError:
+            adapter = self._adapters[annotation] = TypeAdapter(annotation)
+            return adapter
+
+    def validate(self, annotation, data):
+        """Shorthand for adapter(annotation).validate_python(data)."""
+        return self.adapter(annotation).validate_python(data)
+
+# Module-level pool: modules import this instead of each building their own
+# adapters, so the cache is shared process-wide.
+POOL = ModelValidatorPool()
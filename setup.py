@@ -0,0 +1,28 @@
+"""Optional Cython build for the example modules.
+
+The examples run fine as plain Python - this is an experiment following the
+pattern pydantic v1 itself used, where compiling the pure-Python source with
+Cython (no source changes, "pure Python" mode) cut interpreter dispatch
+overhead on the Python-level loops by roughly 30%.
+
+Usage:
+    pip install cython
+    python setup.py build_ext --inplace
+
+This produces .so modules next to the .py files; Python prefers the compiled
+versions on import. Skip this step entirely for normal use.
+"""
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    raise SystemExit(
+        "Cython is not installed. Run 'pip install cython' first, "
+        "or just run the examples as plain Python - compiling is optional."
+    )
+
+setup(
+    name="pydantic-tutorials",
+    ext_modules=cythonize(["examples/*.py"], language_level=3),
+)